@@ -11,9 +11,28 @@ from src.tools.adapters.sanitize import sanitize_tool_result_for_json_string
 import structlog
 import json
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 logger = structlog.get_logger(__name__)
 
 
+def _dumps(obj: Any) -> str:
+    """Serialize to a JSON str, using orjson when installed.
+
+    Deepgram only accepts control messages as text frames (binary frames are
+    treated as audio), so the orjson bytes are decoded before sending.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except (TypeError, orjson.JSONEncodeError):
+            pass
+    return json.dumps(obj)
+
+
 class DeepgramToolAdapter:
     """
     Adapter for Deepgram Voice Agent API tool calling.
@@ -223,11 +242,11 @@ class DeepgramToolAdapter:
             "type": "FunctionCallResponse",
             "id": function_call_id,
             "name": function_name,
-            "content": json.dumps(safe_result)  # Stringify JSON (size-capped)
+            "content": _dumps(safe_result)  # Stringify JSON (size-capped)
         }
         
         try:
-            await websocket.send(json.dumps(response))
+            await websocket.send(_dumps(response))
             logger.info(
                 f"✅ Sent tool result to Deepgram: {safe_result.get('status')}",
                 call_id=context.get("call_id"),
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import functools
 from typing import Any, Dict, Optional
 
 import structlog
+from jinja2 import Template
 from jinja2.sandbox import SandboxedEnvironment
 from markupsafe import Markup
 
@@ -11,6 +13,13 @@ logger = structlog.get_logger(__name__)
 _ENV = SandboxedEnvironment(autoescape=True)
 
 
+@functools.lru_cache(maxsize=128)
+def _compile(source: str) -> Template:
+    # Compiled templates are immutable and safe to share; the default and
+    # per-context override templates repeat across calls, so skip re-parsing.
+    return _ENV.from_string(source)
+
+
 def _normalize_template(raw: Any) -> Optional[str]:
     if raw is None:
         return None
@@ -44,7 +53,7 @@ def render_html_template(
             safe_vars[k] = Markup(v)
         else:
             safe_vars[k] = v
-    template = _ENV.from_string(html_template)
+    template = _compile(html_template)
     return template.render(**safe_vars)
 
 
@@ -0,0 +1,96 @@
+import json
+
+import pytest
+
+from src.tools.adapters import deepgram
+from src.tools.adapters.deepgram import DeepgramToolAdapter
+from src.tools.registry import ToolRegistry
+
+
+class _FakeWebSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, data):
+        self.sent.append(data)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_send_tool_result_sends_text_frame():
+    adapter = DeepgramToolAdapter(ToolRegistry())
+    ws = _FakeWebSocket()
+
+    await adapter.send_tool_result(
+        {
+            "function_call_id": "call_1",
+            "function_name": "hangup_call",
+            "status": "success",
+            "message": "Goodbye — see you",
+        },
+        {"websocket": ws, "call_id": "c1"},
+    )
+
+    assert len(ws.sent) == 1
+    # Binary frames are treated as audio by Deepgram; responses must be text.
+    assert isinstance(ws.sent[0], str)
+    response = json.loads(ws.sent[0])
+    assert response["type"] == "FunctionCallResponse"
+    assert response["id"] == "call_1"
+    assert response["name"] == "hangup_call"
+    content = json.loads(response["content"])
+    assert content["status"] == "success"
+    assert content["message"] == "Goodbye — see you"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_send_tool_result_falls_back_to_json_without_orjson(monkeypatch):
+    monkeypatch.setattr(deepgram, "orjson", None)
+    adapter = DeepgramToolAdapter(ToolRegistry())
+    ws = _FakeWebSocket()
+
+    await adapter.send_tool_result(
+        {
+            "function_call_id": "call_2",
+            "function_name": "hangup_call",
+            "status": "success",
+            "message": "ok",
+        },
+        {"websocket": ws, "call_id": "c1"},
+    )
+
+    assert len(ws.sent) == 1
+    assert isinstance(ws.sent[0], str)
+    response = json.loads(ws.sent[0])
+    assert response["id"] == "call_2"
+    assert json.loads(response["content"])["status"] == "success"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_send_tool_result_falls_back_when_orjson_rejects_value():
+    orjson = pytest.importorskip("orjson")
+    big = 2**70
+    # orjson only serializes 64-bit integers; json handles arbitrary ints.
+    with pytest.raises(orjson.JSONEncodeError):
+        orjson.dumps(big)
+
+    adapter = DeepgramToolAdapter(ToolRegistry())
+    ws = _FakeWebSocket()
+
+    await adapter.send_tool_result(
+        {
+            "function_call_id": "call_3",
+            "function_name": "lookup",
+            "status": "success",
+            "message": "ok",
+            "result": {"count": big},
+        },
+        {"websocket": ws, "call_id": "c1"},
+    )
+
+    assert len(ws.sent) == 1
+    assert isinstance(ws.sent[0], str)
+    response = json.loads(ws.sent[0])
+    assert json.loads(response["content"])["result"] == {"count": big}
@@ -1,4 +1,4 @@
-from src.tools.business.template_renderer import render_html_template
+from src.tools.business.template_renderer import _compile, render_html_template
 
 
 def test_plain_text_variables_are_autoescaped() -> None:
@@ -26,3 +26,21 @@ def test_other_variables_remain_escaped() -> None:
     )
     assert "<b>unsafe</b>" not in html
     assert "&lt;b&gt;unsafe&lt;/b&gt;" in html
+
+
+def test_compiled_template_is_reused_across_renders() -> None:
+    source = "<p>{{ name }}</p>"
+    first = render_html_template(html_template=source, variables={"name": "a"})
+    hits_before = _compile.cache_info().hits
+    second = render_html_template(html_template=source, variables={"name": "b"})
+    assert first == "<p>a</p>"
+    assert second == "<p>b</p>"
+    assert _compile.cache_info().hits == hits_before + 1
+
+
+def test_distinct_sources_do_not_share_compiled_template() -> None:
+    first = render_html_template(html_template="<p>{{ name }}</p>", variables={"name": "a"})
+    second = render_html_template(html_template="<h1>{{ name }}</h1>", variables={"name": "a"})
+    assert first == "<p>a</p>"
+    assert second == "<h1>a</h1>"
+    assert _compile("<p>{{ name }}</p>") is not _compile("<h1>{{ name }}</h1>")